@@ -58,9 +58,37 @@
 +----------------------------------------------------------------------+
 '''
 import numpy as np
-import random as rng
 import warnings as wrn
-from collections import Counter
+import os
+import operator as op
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial, lru_cache
+from copy import deepcopy
+
+
+def _is_jitted(function):
+    #Numba (optional dependency) is only imported if the function comes from it
+    if not type(function).__module__.startswith('numba'):
+        return False
+    from numba.extending import is_jitted
+    return is_jitted(function)
+
+
+@lru_cache(maxsize=None)
+def _jitted_costs():
+    #Compiled loop built on first use, to evaluate a numba compiled cost function over a batch
+    #of points (one point per row)
+    import numba as nb
+
+    @nb.njit
+    def jitted_costs(function, evaluated_positions):
+        costs = np.empty(evaluated_positions.shape[0])
+        for i in range(evaluated_positions.shape[0]):
+            costs[i] = function(evaluated_positions[i])
+        return costs
+
+    return jitted_costs
 
 
 class abc:
@@ -80,6 +108,10 @@ class abc:
             
             Use "my_func" as parameter.
 
+        Obs.: If numba is installed and the function is compiled with 
+        numba.njit, the points of each bee phase are evaluated inside 
+        compiled code, avoiding the Python call overhead.
+
 
     boundaries : List of Tuples
         A list of tuples containing the lower and upper boundaries of 
@@ -118,6 +150,25 @@ class abc:
         Obs.: Scout_limit is rounded down in all cases.
 
 
+    [scout_strategy] : String --optional-- (default: 'random')
+        Determines how a scout bee replaces a discarded food source.
+            - If scout_strategy = 'random' : (default)
+                The new food source is randomized inside boundaries.
+
+            - If scout_strategy = 'rwde' : 
+                Random walk with direction exploitation. The new food 
+                source is placed at a random direction around the best 
+                solution found so far:
+                    x_new = x_best + scout_lambda * (ub - lb) * u
+                where "u" is a random unit vector. Usually reaches 
+                good solutions with less function evaluations.
+
+
+    [scout_lambda] : Float --optional-- (default: 0.1)
+        Only used with "scout_strategy='rwde'". Step of the random walk 
+        as a fraction of the boundaries range of each dimension.
+
+
     [iterations] : Int --optional-- (default: 50)
         The number of iterations executed by algorithm.
 
@@ -146,24 +197,72 @@ class abc:
         If true, beecolpy will register, before each iteration, the
         position of each food source. Useful to debug but, if there a
         high amount of food sources and/or iterations, this option
-        drastically increases memory usage.
+        drastically increases memory usage. If false, no position is 
+        copied during fit().
 
 
     [seed] : Int --optional-- (default: None)
         If defined as an int, set the seed used in all random process.
 
 
+    [vectorized] : Boolean --optional-- (default: False)
+        If true, "function" receives a 2D array where each row is a 
+        point of the function domain and must return a 1D array with 
+        the cost of each row. This allows the employer and onlooker 
+        bee phases to evaluate their neighbor points in batches, which 
+        is much faster for functions written with numpy.
+        Example:
+            def my_func(x): return x[:,0]**2 + x[:,1]**2 + 5*x[:,1]
+
+
+    [dtype] : Numpy float type --optional-- (default: np.float64)
+        Float type used to store the food sources positions (and the 
+        log of agents). Using "np.float32" halves the memory usage, 
+        which is useful with big colonies in high dimensions.
+
+        Obs.: Costs and fits are always calculated in double 
+        precision. With "np.float32" the function receives single 
+        precision points and the positions (and the solution) have a 
+        relative resolution of about 1e-7.
+
+
+    [workers] : Int or map-like callable --optional-- (default: 1)
+        Parallelizes the evaluation of food sources batches (colony 
+        initialization, employer and onlooker bee phases) when 
+        "function" is not vectorized neither numba compiled.
+            - If workers = 1 : (default)
+                Serial evaluation.
+
+            - If workers > 1 : 
+                Evaluation splitted in "workers" processes.
+
+            - If workers = -1 : 
+                Evaluation splitted in all available CPU cores.
+
+            - If workers is a map-like callable : 
+                Evaluation through "workers(function, positions)". 
+                Example: concurrent.futures.ThreadPoolExecutor().map
+
+        Obs.: Only useful to expensive functions. Using processes 
+        requires a picklable "function" (defined at module level). 
+        Copies (copy.deepcopy) of the object share the same map-like 
+        callable, and an object with a map-like callable can't be 
+        pickled.
+
+
     Methods
     ----------
     fit()
         Execute the algorithm with defined parameters.
 
-        Obs.: Returns a list with values found as minimum/maximum 
-        coordinate.
+        Obs.: Returns a list with the coordinate found as 
+        minimum/maximum (a copy, changing it does not affect the 
+        solver).
 
 
     get_solution()
-        Returns the value obtained after fit() the method.
+        Returns a list with the coordinate found as minimum/maximum 
+        after fit() the method.
 
 
     get_status()
@@ -174,8 +273,9 @@ class abc:
 
 
     get_agents()
-        Returns a list with the position of each food source during
-        each iteration if "log_agents = True".
+        Returns an array with the position of each food source during
+        each iteration if "log_agents = True". The array has the shape 
+        (logged iterations, food sources, dimension).
 
         Parameters
         ----------
@@ -215,13 +315,33 @@ class abc:
                  min_max: str='min',
                  nan_protection: bool=True,
                  log_agents: bool=False,
-                 seed: int=None):
+                 seed: int=None,
+                 vectorized: bool=False,
+                 scout_strategy: str='random',
+                 scout_lambda: float=0.1,
+                 dtype=np.float64,
+                 workers=1):
+
+        self.dtype = np.dtype(dtype)
+        if (self.dtype not in (np.float32, np.float64)):
+            raise Exception('\nInvalid dtype. Valid values include:\nnp.float32\nnp.float64')
 
         self.boundaries = boundaries
+        self.dimension = len(self.boundaries)
+        bounds = np.asarray(self.boundaries, dtype=self.dtype).reshape(self.dimension, 2)
+        self.lower_bounds = bounds[:, 0].copy()
+        self.upper_bounds = bounds[:, 1].copy()
+        self.bounds_range = self.upper_bounds - self.lower_bounds
         self.min_max_selector = min_max
+        self._cost_to_fit = _ABC_engine.min_fits if (self.min_max_selector == 'min') \
+                                                 else _ABC_engine.max_fits
         self.cost_function = function
         self.nan_protection = nan_protection
         self.log_agents = log_agents
+        self.vectorized = vectorized
+        self.jitted_function = _is_jitted(function)
+        self.workers = workers
+        self._map = map
         self.reset_agents = False
         self.seed = seed
 
@@ -236,85 +356,136 @@ class abc:
             wrn.warn(warn_message, RuntimeWarning)
 
         if (scouts <= 0):
-            self.scout_limit = int(self.employed_onlookers_count * len(self.boundaries))
+            self.scout_limit = int(self.employed_onlookers_count * self.dimension)
             if (scouts < 0):
                 warn_message = 'Negative scout count given, using default scout ' \
                     'count: colony_size * dimension = ' + str(self.scout_limit)
                 wrn.warn(warn_message, RuntimeWarning)
         elif (scouts < 1):
-            self.scout_limit = int(self.employed_onlookers_count * len(self.boundaries) * scouts)
+            self.scout_limit = int(self.employed_onlookers_count * self.dimension * scouts)
         else:
             self.scout_limit = int(scouts)
 
+        self.scout_strategy = scout_strategy
+        self.scout_lambda = scout_lambda
+        if (self.scout_strategy not in ('random', 'rwde')):
+            raise Exception('\nInvalid scout strategy. Valid values include:\n\'random\'\n\'rwde\'')
+
+        if not(callable(self.workers) or (self.workers == -1) or \
+               (isinstance(self.workers, int) and (self.workers >= 1))):
+            raise Exception('\nInvalid workers. Use a positive int, -1 (all CPU cores) ' \
+                            'or a map-like callable.')
+
         self.scout_status = 0
         self.iteration_status = 0
         self.nan_status = 0
 
-        if (self.seed is not None):
-            rng.seed(self.seed)
+        self._rng = np.random.default_rng(self.seed)
+        self._engine = _ABC_engine(self)
 
-        self.foods = [None] * self.employed_onlookers_count
-        for i in range(len(self.foods)):
-            _ABC_engine(self).generate_food_source(i)
+        #Food sources are stored as Struct-of-Arrays: one row (or item) per food source
+        with self._workers_pool():
+            self._engine.initialize_food_sources()
 
         try:
-            self.best_food_source = self.foods[np.nanargmax([food.fit for food in self.foods])]
-        except:
-            self.best_food_source = self.foods[0]
+            best_food_index = np.nanargmax(self.fits)
+        except ValueError:
+            best_food_index = 0
             warn_message = 'All food sources\'s fit resulted in NaN and beecolpy can got stuck ' \
                          'in an infinite loop during fit(). Enable nan_protection to prevent this.'
             wrn.warn(warn_message, RuntimeWarning)
+        self.best_fit = self.fits[best_food_index]
+        self.best_position = self.positions[best_food_index].copy()
 
-        self.agents = []
-        if self.log_agents:
-            self.agents.append([food.position for food in self.foods])
+        #Food sources log with shape (logged iterations, food sources, dimension)
+        self.agents = self.positions[np.newaxis].copy() if self.log_agents else None
 
 
     def fit(self):
         '''
         Execute the algorithm with defined parameters.
 
-        Obs.: Returns a list with values found as minimum/maximum 
-        coordinate.
+        Obs.: Returns a list with the coordinate found as 
+        minimum/maximum (a copy, changing it does not affect the 
+        solver).
         '''
         if (self.seed is not None):
-            rng.seed(self.seed)
+            self._rng = np.random.default_rng(self.seed)
 
         if self.reset_agents:
-            self.agents = []
-            if self.log_agents:
-                self.agents.append([food.position for food in self.foods])
+            self.agents = self.positions[np.newaxis].copy()
             self.reset_agents = False
 
-        for _ in range(self.max_iterations):
-            #--> Employer bee phase <--
-            #Generate and evaluate a neighbor point to every food source
-            _ABC_engine(self).employer_bee_phase()
+        if self.log_agents:
+            #Reserve the log of all iterations at once (unused rows are dropped at the end)
+            logged_iterations = len(self.agents)
+            self.agents = np.concatenate((self.agents,
+                                          np.empty((self.max_iterations,) + self.positions.shape,
+                                                   dtype=self.dtype)))
+
+        try:
+            with self._workers_pool():
+                for _ in range(self.max_iterations):
+                    #--> Employer bee phase <--
+                    #Generate and evaluate a neighbor point to every food source
+                    self._engine.employer_bee_phase()
+
+                    #--> Onlooker bee phase <--
+                    #Based in probability, generate a neighbor point and evaluate again some food sources
+                    #Same food source can be evaluated multiple times
+                    self._engine.onlooker_bee_phase()
+
+                    #--> Memorize best solution <--
+                    self._engine.memorize_best_solution()
+
+                    #--> Scout bee phase <--
+                    #Generate up to one new food source that does not improve over scout_limit evaluation tries
+                    self._engine.scout_bee_phase()
+
+                    #Update iteration status
+                    self.iteration_status += 1
+                    if self.log_agents:
+                        self.agents[logged_iterations] = self.positions
+                        logged_iterations += 1
+        finally:
+            if self.log_agents:
+                self.agents = self.agents[:logged_iterations]
 
-            #--> Onlooker bee phase <--
-            #Based in probability, generate a neighbor point and evaluate again some food sources
-            #Same food source can be evaluated multiple times
-            _ABC_engine(self).onlooker_bee_phase()
+        return self.best_position.tolist()
 
-            #--> Memorize best solution <--
-            _ABC_engine(self).memorize_best_solution()
 
-            #--> Scout bee phase <--
-            #Generate up to one new food source that does not improve over scout_limit evaluation tries
-            _ABC_engine(self).scout_bee_phase()
+    @contextmanager
+    def _workers_pool(self):
+        #Set the map function used to evaluate batches of food sources inside the block
+        pool = None
+        if callable(self.workers):
+            self._map = self.workers
+        elif (self.workers != 1):
+            workers_count = os.cpu_count() if (self.workers == -1) else self.workers
+            pool = ProcessPoolExecutor(max_workers=workers_count)
+            self._map = partial(_ABC_engine.pool_map, pool, workers_count)
+        try:
+            yield
+        finally:
+            self._map = map
+            if (pool is not None):
+                pool.shutdown()
 
-            #Update iteration status
-            self.iteration_status += 1
-            if self.log_agents:
-                self.agents.append([food.position for food in self.foods])
 
-        return self.best_food_source.position
+    def __deepcopy__(self, memo):
+        #"workers" is an external resource (e.g. a pool map), so copies share it
+        memo[id(self.workers)] = self.workers
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__dict__.update(deepcopy(self.__dict__, memo))
+        return copied
 
 
     def get_agents(self, reset_agents: bool=False):
         '''
-        Returns a list with the position of each food source during
-        each iteration.
+        Returns an array with the position of each food source during
+        each iteration. The array has the shape (logged iterations, 
+        food sources, dimension).
 
         Parameters
         ----------
@@ -324,16 +495,17 @@ class abc:
         '''
         assert self.log_agents, 'Food source logging disabled.'
         self.reset_agents = reset_agents
-        return self.agents
+        return self.agents.copy()
 
 
     def get_solution(self):
         '''
-        Returns the value obtained after fit() the method.
+        Returns a list with the coordinate found as minimum/maximum 
+        after fit() the method.
 
         '''
         assert (self.iteration_status > 0), 'fit() not executed yet!'
-        return self.best_food_source.position
+        return self.best_position.tolist()
 
 
     def get_status(self):
@@ -545,24 +717,41 @@ class bin_abc:
         If true, beecolpy will register, before each iteration, the
         position of each food source. Useful to debug but, if there a
         high amount of food sources and/or iterations, this option
-        drastically increases memory usage.
+        drastically increases memory usage. If false, no position is 
+        copied during fit().
 
 
     [seed] : Int --optional-- (default: None)
         If defined as an int, set the seed used in all random process.
 
 
+    [memoize] : Boolean --optional-- (default: False)
+        If true, the cost of each evaluated bit vector is stored and 
+        reused every time the same bit vector is evaluated again. As 
+        the binary domain has a finite number of bit vectors, the 
+        colony usually revisits them many times, so this option 
+        avoids most of the function calls of expensive cost 
+        functions. The stored costs only live during each fit() 
+        call (and the initialization), so the memory usage is limited 
+        to the bit vectors evaluated by a single fit().
+
+        Obs.: Only use this option with deterministic cost functions.
+        If the function has random elements applied to each call, 
+        keep memoize = False.
+
+
     Methods
     ----------
     fit()
         Execute the algorithm with defined parameters.
 
-        Obs.: Returns a list with values found as minimum/maximum 
-        coordinate.
+        Obs.: Returns a list of bools with the bit vector found as 
+        minimum/maximum.
 
 
     get_solution()
-        Returns the value obtained after fit() the method.
+        Returns a list of bools with the bit vector found as 
+        minimum/maximum after fit() the method.
 
         Parameters
         ----------
@@ -587,8 +776,9 @@ class bin_abc:
 
 
     get_agents()
-        Returns a list with the position of each food source during
-        each iteration if "log_agents = True".
+        Returns an array with the position of each food source during
+        each iteration if "log_agents = True". The array has the shape 
+        (logged iterations, food sources, dimension).
 
         Obs.: In binary form, this method returns the position of 
         each food source after transformation "binary -> continuous". 
@@ -662,11 +852,17 @@ class bin_abc:
                  result_format: str='best',
                  best_model_iterations: int=0,
                  log_agents: bool=False,
-                 seed: int=None):
+                 seed: int=None,
+                 memoize: bool=False):
 
         self.method = method
         self.function = function
         self.seed = seed
+        self._reset_rng()
+
+        self.memoize = memoize
+        self._cost_cache = {}
+        self._function = self._memoized_function if self.memoize else self.function
 
         bits_count = int(bits_count)
         if ((len(boundaries) == 0) and (bits_count <= 0)):
@@ -687,7 +883,8 @@ class bin_abc:
             boundaries = [(-2, 2) for _ in range(bits_count)] if (len(boundaries) == 0) \
                                                               else boundaries
 
-            self._bin_abc_object = abc(function = _AMABC_engine(self).am_cost_function,
+            self._engine = _AMABC_engine(self)
+            self._bin_abc_object = abc(function = self._engine.am_cost_function,
                                        boundaries = boundaries,
                                        colony_size = colony_size,
                                        scouts = scouts,
@@ -702,7 +899,9 @@ class bin_abc:
             self.min_max_selector = min_max
 
             self.result_format = result_format
-            _BABC_engine(self).check_result_format()
+            self._engine = _BABC_engine(self)
+            self._engine.check_result_format()
+            self._engine.check_transfer_function()
 
             best_model_iterations = best_model_iterations if (best_model_iterations > 0) \
                                                           else iterations
@@ -718,7 +917,7 @@ class bin_abc:
             self.boundaries = [(-10, 10) for _ in range(bits_count)] if (len(boundaries) == 0) \
                                                                      else boundaries
 
-            self._bin_abc_object = abc(function = _BABC_engine(self).bin_cost_function,
+            self._bin_abc_object = abc(function = self._engine.bin_cost_function,
                                        boundaries = self.boundaries,
                                        colony_size = colony_size,
                                        scouts = scouts,
@@ -731,32 +930,56 @@ class bin_abc:
         else:
             raise Exception('\nInvalid method. Valid values include:\n\'am\'\n\'bin\'')
 
+        self._cost_cache.clear()
+
 
     def fit(self):
         '''
         Execute the algorithm with defined parameters.
 
-        Obs.: Returns a list with values found as minimum/maximum 
-        coordinate.
+        Obs.: Returns a list of bools with the bit vector found as 
+        minimum/maximum.
         '''
-        self._bin_abc_object.fit()
-        self.executed_bin_fit = True
-        if (self.method == 'am'): #Angle Modulated
-            self.result_bit_vector = _AMABC_engine(self).get_bit_vector(
+        if (self.seed is not None):
+            self._reset_rng()
+
+        #Re-select on each fit so changes to "function"/"memoize" after construction are honored
+        self._function = self._memoized_function if self.memoize else self.function
+        try:
+            self._bin_abc_object.fit()
+            self.executed_bin_fit = True
+            if (self.method == 'am'): #Angle Modulated
+                self.result_bit_vector = self._engine.get_bit_vector(
                                                             self._bin_abc_object.get_solution())
-        elif (self.method == 'bin'): #Binary ABC
-            if (self.seed is not None):
-                rng.seed(self.seed)
+            elif (self.method == 'bin'): #Binary ABC
+                if (self.seed is not None):
+                    self._reset_rng()
 
-            self.result_bit_vector = _BABC_engine(self).get_result_vector(
+                self.result_bit_vector = self._engine.get_result_vector(
                                                             self._bin_abc_object.get_solution())
-        return self.result_bit_vector
+        finally:
+            self._cost_cache.clear()
+        return list(self.result_bit_vector)
+
+
+    def _memoized_function(self, bit_vector):
+        #Cost of each bit vector is calculated only once
+        key = tuple(bit_vector)
+        if (key not in self._cost_cache):
+            self._cost_cache[key] = self.function(bit_vector)
+        return self._cost_cache[key]
+
+
+    def _reset_rng(self):
+        #Bits are sampled from a stream independent of the one used by the food sources
+        self._rng = np.random.default_rng(np.random.SeedSequence(self.seed).spawn(1)[0])
 
 
     def get_agents(self, reset_agents: bool=False):
         '''
-        Returns a list with the position of each food source during
-        each iteration.
+        Returns an array with the position of each food source during
+        each iteration. The array has the shape (logged iterations, 
+        food sources, dimension).
 
         Obs.: In binary form, this method returns the position of 
         each food source after transformation "binary -> continuous". 
@@ -774,7 +997,8 @@ class bin_abc:
 
     def get_solution(self, probability_vector: bool=False):
         '''
-        Returns the value obtained after fit() the method.
+        Returns a list of bools with the bit vector found as 
+        minimum/maximum after fit() the method.
 
         Parameters
         ----------
@@ -793,10 +1017,10 @@ class bin_abc:
         assert self.executed_bin_fit, 'fit() not executed yet!'
 
         if (probability_vector and (self.method == 'bin') and self.executed_bin_fit):
-            return _BABC_engine(self).get_probability_vector(
+            return self._engine.get_probability_vector(
                                             self._bin_abc_object.get_solution())
         else:
-            return self.result_bit_vector
+            return list(self.result_bit_vector)
 
 
     def get_status(self):
@@ -814,62 +1038,69 @@ class bin_abc:
 
 
 
-class _FoodSource:
-    def __init__(self, abc, engine):
-        #When a food source is initialized, randomize a position inside boundaries and calculate the "fit"
-        self.abc = abc
-        self.engine = engine
-        self.trial_counter = 0
-        self.position = [rng.uniform(*self.abc.boundaries[i]) for i in range(len(self.abc.boundaries))]
-        self.fit = self.engine.calculate_fit(self.position)
+class _ABC_engine:
+    __slots__ = ('abc',)
 
+    def __init__(self, abc):
+        self.abc = abc
 
-    def evaluate_neighbor(self, partner_position):
-        #Randomize one coodinate (one dimension) to generate a neighbor point
-        j = rng.randrange(0, len(self.abc.boundaries))
 
-        #eq. (2.2) [1] (new coordinate "x_j" to generate a neighbor point)
-        xj_new = self.position[j] + rng.uniform(-1, 1)*(self.position[j] - partner_position[j])
+    def check_nan_lock(self):
+        if not(self.abc.nan_protection):
+            if np.all(np.isnan(self.abc.fits)):
+                raise Exception('All food sources\'s fit resulted in NaN and beecolpy got ' \
+                                'stuck in an infinite loop. Enable nan_protection to prevent this.')
 
-        #Check boundaries
-        xj_new = self.abc.boundaries[j][0] if (xj_new < self.abc.boundaries[j][0]) else \
-            self.abc.boundaries[j][1] if (xj_new > self.abc.boundaries[j][1]) else xj_new
 
-        #Changes the coordinate "j" from food source to new "x_j" generating the neighbor point
-        neighbor_position = [(self.position[i] if (i != j) else xj_new) for i in range(len(self.abc.boundaries))]
-        neighbor_fit = self.engine.calculate_fit(neighbor_position)
+    def random_positions(self, size):
+        #Randomize positions inside boundaries (one position per row)
+        return self.abc.lower_bounds + self.abc.bounds_range * \
+               self.abc._rng.random((size, self.abc.dimension), dtype=self.abc.dtype)
 
-        #Greedy selection
-        if (neighbor_fit > self.fit):
-            self.position = neighbor_position
-            self.fit = neighbor_fit
-            self.trial_counter = 0
-        else:
-            self.trial_counter += 1
 
+    def random_food_source(self, index):
+        #Randomize a position inside boundaries and calculate the "fit"
+        self.abc.positions[index] = self.random_positions(1)[0]
+        self.abc.fits[index] = self.calculate_fit(self.abc.positions[index])
+        self.abc.trial_counters[index] = 0
 
 
+    def initialize_food_sources(self):
+        #All food sources are randomized at once and evaluated as a single batch
+        self.abc.positions = self.random_positions(self.abc.employed_onlookers_count)
+        self.abc.fits = self.calculate_fits(self.abc.positions)
+        self.abc.trial_counters = np.zeros(self.abc.employed_onlookers_count, dtype=np.int64)
 
-class _ABC_engine:
-    def __init__(self, abc):
-        self.abc = abc
-
-
-    def check_nan_lock(self):
-        if not(self.abc.nan_protection):
-            if np.all([np.isnan(food.fit) for food in self.abc.foods]):
-                raise Exception('All food sources\'s fit resulted in NaN and beecolpy got ' \
-                                'stuck in an infinite loop. Enable nan_protection to prevent this.')
+        #NaN protection: re-generate all NaN food sources at once until none remains
+        nan_indexes = np.flatnonzero(np.isnan(self.abc.fits))
+        while ((len(nan_indexes) > 0) and self.abc.nan_protection):
+            self.abc.nan_status += len(nan_indexes)
+            self.abc.positions[nan_indexes] = self.random_positions(len(nan_indexes))
+            self.abc.fits[nan_indexes] = self.calculate_fits(self.abc.positions[nan_indexes])
+            nan_indexes = nan_indexes[np.isnan(self.abc.fits[nan_indexes])]
 
 
     def execute_nan_protection(self, food_index):
-        while (np.isnan(self.abc.foods[food_index].fit) and self.abc.nan_protection):
+        while (np.isnan(self.abc.fits[food_index]) and self.abc.nan_protection):
             self.abc.nan_status += 1
-            self.abc.foods[food_index] = _FoodSource(self.abc, self)
+            self.random_food_source(food_index)
 
 
     def generate_food_source(self, index):
-        self.abc.foods[index] = _FoodSource(self.abc, self)
+        self.random_food_source(index)
+        self.execute_nan_protection(index)
+
+
+    def vicinity_food_source(self, index):
+        #Random walk with direction exploitation (RWDE): walk a step of "scout_lambda" (relative to
+        #boundaries range) from the best solution found so far towards a random direction
+        direction = self.abc._rng.standard_normal(self.abc.dimension, dtype=self.abc.dtype)
+        direction /= np.linalg.norm(direction)
+        step = self.abc.scout_lambda * self.abc.bounds_range * direction
+        self.abc.positions[index] = np.clip(self.abc.best_position + step,
+                                            self.abc.lower_bounds, self.abc.upper_bounds)
+        self.abc.fits[index] = self.calculate_fit(self.abc.positions[index])
+        self.abc.trial_counters[index] = 0
         self.execute_nan_protection(index)
 
 
@@ -877,75 +1108,146 @@ class _ABC_engine:
         # Improved probability function [7]
         return 0.9*(actual_fit/max_fit) + 0.1
         # Original probability function [1]
-        # return actual_fit/np.sum([food.fit for food in self.abc.foods])
+        # return actual_fit/np.sum(self.abc.fits)
+
+
+    @staticmethod
+    def min_fits(costs):
+        #eq. (2) [2] (Convert "cost function" to "fit function") to minimize function
+        fit_values = 1 + np.abs(costs)
+        selector = ~(costs < 0)
+        fit_values[selector] = 1/(1 + costs[selector])
+        return fit_values
+
+
+    @staticmethod
+    def max_fits(costs):
+        #eq. (2) [2] (Convert "cost function" to "fit function") to maximize function
+        fit_values = 1/(1 + np.abs(costs))
+        selector = (costs > 0)
+        fit_values[selector] = 1 + costs[selector]
+        return fit_values
 
 
     def calculate_fit(self, evaluated_position):
-        #eq. (2) [2] (Convert "cost function" to "fit function")
-        cost = self.abc.cost_function(evaluated_position)
-        if (self.abc.min_max_selector == 'min'): #Minimize function
-            fit_value = (1 + np.abs(cost)) if (cost < 0) else (1/(1 + cost))
-        else: #Maximize function
-            fit_value = (1 + cost) if (cost > 0) else (1/(1 + np.abs(cost)))
-        return fit_value
+        #eq. (2) [2] applied over a single point
+        if self.abc.vectorized:
+            cost = self.abc.cost_function(evaluated_position[np.newaxis, :])[0]
+        else:
+            cost = self.abc.cost_function(evaluated_position)
+        return self.abc._cost_to_fit(np.array([cost], dtype=np.float64))[0]
+
+
+    @staticmethod
+    def pool_map(pool, workers_count, function, evaluated_positions):
+        #Split each batch of points in one chunk per worker (onlooker batches are smaller
+        #than the colony)
+        chunksize = -(-len(evaluated_positions) // workers_count)
+        return pool.map(function, evaluated_positions, chunksize=max(chunksize, 1))
+
+
+    def calculate_fits(self, evaluated_positions):
+        #eq. (2) [2] applied over a batch of points (one point per row)
+        #Obs.: Fits are always double precision, whatever the positions dtype, because
+        #1/(1 + cost) can't distinguish costs smaller than ~1e-7 in single precision
+        if self.abc.vectorized:
+            costs = np.asarray(self.abc.cost_function(evaluated_positions), dtype=np.float64)
+        elif self.abc.jitted_function:
+            costs = _jitted_costs()(self.abc.cost_function, evaluated_positions)
+        else:
+            costs = np.array(list(self.abc._map(self.abc.cost_function, evaluated_positions)),
+                             dtype=np.float64)
+        return self.abc._cost_to_fit(costs)
 
 
-    def food_source_dance(self, index):
+    def select_partner(self, index):
         #Generate a partner food source to generate a neighbor point to evaluate
-        while True: #Criterion from [1] geting another food source at random
-            d = int(rng.randrange(0, self.abc.employed_onlookers_count))
-            if (d != index):
-                break
-        self.abc.foods[index].evaluate_neighbor(self.abc.foods[d].position)
+        #Criterion from [1] geting another food source at random, drawing an offset
+        #from "index" avoids resampling when the food source itself is drawn
+        #Obs.: "index" can be a single food source or an array of food sources
+        offset = self.abc._rng.integers(1, self.abc.employed_onlookers_count,
+                                        size=(np.shape(index) or None))
+        return (index + offset) % self.abc.employed_onlookers_count
+
+
+    def food_sources_dance(self, food_indexes):
+        #Generate and evaluate a neighbor point to each food source in "food_indexes" (without
+        #repeated indexes). All neighbor points are built from the current colony and evaluated
+        #as one batch
+        positions = self.abc.positions
+        partners = self.select_partner(food_indexes)
+
+        #Randomize one coodinate (one dimension) of each food source to generate a neighbor point
+        j = self.abc._rng.integers(0, self.abc.dimension, size=len(food_indexes))
+        phi = self.abc._rng.uniform(-1, 1, size=len(food_indexes)).astype(self.abc.dtype, copy=False)
+
+        #eq. (2.2) [1] with boundaries check
+        xj = positions[food_indexes, j]
+        neighbor_positions = positions[food_indexes]
+        neighbor_positions[np.arange(len(food_indexes)), j] = np.clip(
+                                                    xj + phi*(xj - positions[partners, j]),
+                                                    self.abc.lower_bounds[j],
+                                                    self.abc.upper_bounds[j])
+        neighbor_fits = self.calculate_fits(neighbor_positions)
+
+        #Greedy selection
+        improved = (neighbor_fits > self.abc.fits[food_indexes])
+        improved_indexes = food_indexes[improved]
+        positions[improved_indexes] = neighbor_positions[improved]
+        self.abc.fits[improved_indexes] = neighbor_fits[improved]
+        self.abc.trial_counters[improved_indexes] = 0
+        self.abc.trial_counters[food_indexes[~improved]] += 1
 
 
     def employer_bee_phase(self):
         #Generate and evaluate a neighbor point to every food source
-        for i in range(len(self.abc.foods)):
-            self.food_source_dance(i)
+        self.food_sources_dance(np.arange(self.abc.employed_onlookers_count))
 
 
     def onlooker_bee_phase(self):
         #Based in probability, generate a neighbor point and evaluate again some food sources
         #Same food source can be evaluated multiple times
         self.check_nan_lock()
-        max_fit = np.nanmax([food.fit for food in self.abc.foods])
-        onlooker_probability = [self.prob_i(food.fit, max_fit) for food in self.abc.foods]
-        p = 0 #Onlooker bee index
-        i = 0 #Food source index
-        while (p < self.abc.employed_onlookers_count):
-            if (rng.uniform(0, 1) <= onlooker_probability[i]):
-                p += 1
-                self.food_source_dance(i)
-                self.check_nan_lock()
-                max_fit = np.nanmax([food.fit for food in self.abc.foods])
-                if (self.abc.foods[i].fit != max_fit):
-                    onlooker_probability[i] = self.prob_i(self.abc.foods[i].fit, max_fit)
-                else:
-                    onlooker_probability = [self.prob_i(food.fit, max_fit) for food in self.abc.foods]
-            i = (i+1) if (i < (len(self.abc.foods)-1)) else 0
+        #Roulette wheel selection [1] of all onlookers at once (NaN fits are never selected):
+        #binary search of uniform draws over the cumulative probabilities
+        probabilities = np.nan_to_num(self.prob_i(self.abc.fits, np.nanmax(self.abc.fits)))
+        roulette = np.cumsum(probabilities)
+        roulette /= roulette[-1]
+        picked = roulette.searchsorted(self.abc._rng.random(self.abc.employed_onlookers_count),
+                                       side='right')
+        #A food source picked "k" times dances in the first "k" batches
+        food_indexes, dances = np.unique(picked, return_counts=True)
+        for k in range(dances.max()):
+            self.food_sources_dance(food_indexes[dances > k])
 
 
     def scout_bee_phase(self):
         #Generate up to one new food source that does not improve over scout_limit evaluation tries
-        trial_counters = [food.trial_counter for food in self.abc.foods]
-        if (max(trial_counters) > self.abc.scout_limit):
-            #Take the index of replaced food source
-            trial_counters = np.where(np.array(trial_counters) == max(trial_counters))[0].tolist()
-            i = trial_counters[rng.randrange(0, len(trial_counters))]
-            self.generate_food_source(i) #Replace food source
+        max_trials = self.abc.trial_counters.max()
+        if (max_trials > self.abc.scout_limit):
+            #Take the index of replaced food source (random tie break between the most tried ones)
+            most_tried = np.flatnonzero(self.abc.trial_counters == max_trials)
+            i = self.abc._rng.choice(most_tried)
+            if (self.abc.scout_strategy == 'rwde'):
+                self.vicinity_food_source(i) #Replace food source near the best solution
+            else:
+                self.generate_food_source(i) #Replace food source
             self.abc.scout_status += 1
 
 
     def memorize_best_solution(self):
-        best_food_index = np.nanargmax([food.fit for food in self.abc.foods])
-        if (self.abc.foods[best_food_index].fit >= self.abc.best_food_source.fit):
-            self.abc.best_food_source = self.abc.foods[best_food_index]
+        best_food_index = np.nanargmax(self.abc.fits)
+        iteration_best_fit = self.abc.fits[best_food_index]
+        if (iteration_best_fit >= self.abc.best_fit):
+            self.abc.best_fit = iteration_best_fit
+            self.abc.best_position = self.abc.positions[best_food_index].copy()
 
 
 
 
 class _BABC_engine:
+    __slots__ = ('babc',)
+
     def __init__(self, babc):
         self.babc = babc
 
@@ -957,93 +1259,96 @@ class _BABC_engine:
                             '\n\'average\'\n\'best\'')
 
 
-    def sigmoid(self, x):
-        return 1/(1 + np.exp((-1)*x))
+    #Transfer functions discused in [6] as the "x" scale applied on sigmoid
+    transfer_scales = {'sigmoid': 1,       #S(x) = 1/(1 + exp(-x))
+                       'sigmoid-2x': 2,    #S(x) = 1/(1 + exp(-2*x))
+                       'sigmoid-x/2': 1/2, #S(x) = 1/(1 + exp(-x/2))
+                       'sigmoid-x/3': 1/3} #S(x) = 1/(1 + exp(-x/3))
 
 
-    def transfer(self, value): #Transfer functions discused in [6]
-        if (self.babc.transfer_function == 'sigmoid'):
-            return self.sigmoid(value)   #S(x) = 1/(1 + exp(-x))
-        elif (self.babc.transfer_function == 'sigmoid-2x'):
-            return self.sigmoid(value*2) #S(x) = 1/(1 + exp(-2*x))
-        elif (self.babc.transfer_function == 'sigmoid-x/2'):
-            return self.sigmoid(value/2) #S(x) = 1/(1 + exp(-x/2))
-        elif (self.babc.transfer_function == 'sigmoid-x/3'):
-            return self.sigmoid(value/3) #S(x) = 1/(1 + exp(-x/3))
-        else:
+    def check_transfer_function(self):
+        if (self.babc.transfer_function not in self.transfer_scales):
             raise Exception('\nInvalid transfer function. Valid values include:' \
                 '\n\'sigmoid\'\n\'sigmoid-2x\'\n\'sigmoid-x/2\'\n\'sigmoid-x/3\'')
 
 
+    def sigmoid(self, x):
+        return 1/(1 + np.exp((-1)*x))
+
+
+    def transfer(self, value_vector): #Applied over all values at once
+        return self.sigmoid(np.asarray(value_vector) * self.transfer_scales[self.babc.transfer_function])
+
+
     def get_probability_vector(self, value_vector):
-        return [self.transfer(value) for value in value_vector]
+        return self.transfer(value_vector).tolist()
 
 
-    def get_bit_vector(self, value_vector):
-        probability_vector = self.get_probability_vector(value_vector)
-        return [(rng.uniform(0, 1) < probability) for probability in probability_vector]
+    def sample_bit_vector(self, probability_vector):
+        return (self.babc._rng.random(len(probability_vector)) < probability_vector).tolist()
 
 
-    def recalculate_nan(self, bit_vector, cost_value, value_vector):
+    def sample_bit_vectors(self, probability_vector, count):
+        #Sample "count" bit vectors at once as a boolean matrix (one bit vector per row)
+        return self.babc._rng.random((count, len(probability_vector))) < probability_vector
+
+
+    def recalculate_nan(self, bit_vector, cost_value, probability_vector):
         j = 0
         while (np.isnan(cost_value) and (j < self.babc._nan_count)):
-            bit_vector = self.get_bit_vector(value_vector)
-            cost_value = self.babc.function(bit_vector)
+            bit_vector = self.sample_bit_vector(probability_vector)
+            cost_value = self.babc._function(bit_vector)
             j += 1
         return bit_vector, cost_value
 
 
     def bin_cost_function(self, value_vector):
-        bit_vector = self.get_bit_vector(value_vector)
-        cost_value = self.babc.function(bit_vector)
+        #Transfer function is applied once and reused by NaN retries
+        probability_vector = self.transfer(value_vector)
+        bit_vector = self.sample_bit_vector(probability_vector)
+        cost_value = self.babc._function(bit_vector)
 
         if self.babc._nan_protection:
-            _, cost_value = self.recalculate_nan(bit_vector, cost_value, value_vector)
+            _, cost_value = self.recalculate_nan(bit_vector, cost_value, probability_vector)
 
         return cost_value
 
 
     def get_best_model(self, value_vector):
+        is_better = op.lt if (self.babc.min_max_selector == 'min') else op.gt
         cost_value = np.nan
-        for i in range(self.babc.best_model_iterations):
-            temp_bit_vector = self.get_bit_vector(value_vector)
-            temp_cost_value = self.babc.function(temp_bit_vector)
+        probability_vector = self.transfer(value_vector)
+        bit_vectors = self.sample_bit_vectors(probability_vector, self.babc.best_model_iterations)
+        for i, temp_bits in enumerate(bit_vectors):
+            temp_bit_vector = temp_bits.tolist()
+            temp_cost_value = self.babc._function(temp_bit_vector)
 
             if self.babc._nan_protection:
                 temp_bit_vector, temp_cost_value = self.recalculate_nan(
-                                                    temp_bit_vector, temp_cost_value, value_vector)
-
-            if (self.babc.min_max_selector == 'min'): #Minimize function
-                if ((i < 1) or (temp_cost_value < cost_value)):
-                    cost_value = temp_cost_value
-                    bit_vector = temp_bit_vector
-            else: #Maximize function
-                if ((i < 1) or (temp_cost_value > cost_value)):
-                    cost_value = temp_cost_value
-                    bit_vector = temp_bit_vector
+                                            temp_bit_vector, temp_cost_value, probability_vector)
+
+            if ((i < 1) or is_better(temp_cost_value, cost_value)):
+                cost_value = temp_cost_value
+                bit_vector = temp_bit_vector
         return bit_vector
 
 
     def get_average_model(self, value_vector):
-        solution_collection = np.zeros((self.babc.best_model_iterations, 
-                                        len(self.babc.boundaries)))
-        solution_collection.fill(np.nan)
-        bit_vector = [None] * len(self.babc.boundaries)
+        probability_vector = self.transfer(value_vector)
+        solution_collection = self.sample_bit_vectors(probability_vector,
+                                                      self.babc.best_model_iterations)
 
-        for i in range(self.babc.best_model_iterations):
-            temp_bit_vector = self.get_bit_vector(value_vector)
-
-            if self.babc._nan_protection:
-                temp_cost_value = self.babc.function(temp_bit_vector)
+        if self.babc._nan_protection:
+            for i, temp_bits in enumerate(solution_collection):
+                temp_bit_vector = temp_bits.tolist()
+                temp_cost_value = self.babc._function(temp_bit_vector)
                 temp_bit_vector, _ = self.recalculate_nan(
-                                        temp_bit_vector, temp_cost_value, value_vector)
+                                        temp_bit_vector, temp_cost_value, probability_vector)
+                solution_collection[i,:] = temp_bit_vector
 
-            solution_collection[i,:] = temp_bit_vector
-
-        for j in range(len(self.babc.boundaries)):
-            simulated_bits = solution_collection[:,j]
-            bit_vector[j] = bool(Counter(simulated_bits).most_common(1)[0][0])
-        return bit_vector
+        #Majority vote of each bit (best_model_iterations is always odd, so there are no ties)
+        true_count = np.count_nonzero(solution_collection, axis=0)
+        return (true_count > (self.babc.best_model_iterations // 2)).tolist()
 
 
     def get_result_vector(self, value_vector):
@@ -1058,6 +1363,8 @@ class _BABC_engine:
 
 
 class _AMABC_engine:
+    __slots__ = ('amabc',)
+
     def __init__(self, amabc):
         self.amabc = amabc
 
@@ -1071,8 +1378,8 @@ class _AMABC_engine:
 
 
     def get_bit_vector(self, angle_vector):
-        return [(self.angle_modulation(angle) > 0) for angle in angle_vector]
+        return (self.angle_modulation(np.asarray(angle_vector)) > 0).tolist()
 
 
     def am_cost_function(self, angle_vector):
-        return self.amabc.function(self.get_bit_vector(angle_vector))
+        return self.amabc._function(self.get_bit_vector(angle_vector))
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
-from beecolpy import *
+from beecolpy import abc, bin_abc
 
 from copy import deepcopy
-import math as mt
+from functools import lru_cache
 import numpy as np
+import os
 import numpy.testing as npt
+import pytest
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def sphere(x): #Continuous and NaN benchmark
     #Sphere function
@@ -19,8 +24,18 @@ def sphere(x): #Continuous and NaN benchmark
     else:
         return np.nan
 
+def vectorized_sphere(x): #Vectorized version of "sphere"
+    total = np.sum(x**2, axis=1)
+    test = np.sum(x, axis=1)
+    return np.where(test<5, total, np.nan)
+
+@lru_cache(maxsize=None)
+def powers_of_2(bits_count): #Most significant bit first
+    return 2.0**np.arange(bits_count - 1, -1, -1)
+
 def translate_bin(b):
-    return np.sum([(b[::-1][i])*mt.pow(2,i) for i in range(len(b))])
+    #Dot product between bits and its powers of 2
+    return np.asarray(b, dtype=np.float64) @ powers_of_2(len(b))
 
 def squared_bin(b):
     #y=(x-1)*(x-3)*(x-11)
@@ -32,180 +47,287 @@ def squared_bin(b):
     if (x > 128):
         return np.nan
     else:
-        return mt.pow(x,3) - 15*mt.pow(x,2) + 47*(x) - 33
+        return x*(x*(x - 15) + 47) - 33 #Horner's method
+
+@pytest.fixture(scope='module')
+def base_abc_obj():
+    return abc(function=sphere,
+               boundaries=[(-10,10) for _ in range(2)],
+               colony_size=10,
+               scouts=0.5,
+               iterations=10,
+               min_max='min',
+               nan_protection=True,
+               log_agents=True,
+               seed=42)
+
+@pytest.fixture(scope='module')
+def base_bin_abc_obj():
+    return bin_abc(function=squared_bin,
+                   bits_count=4,
+                   transfer_function='sigmoid',
+                   colony_size=10,
+                   scouts=0.5,
+                   iterations=10,
+                   min_max='min',
+                   method='bin',
+                   result_format='best',
+                   nan_protection=3,
+                   log_agents=True,
+                   seed=42)
 
-base_abc_obj = abc(function=sphere,
-                   boundaries=[(-10,10) for _ in range(2)],
+@pytest.fixture(scope='module')
+def base_am_abc_obj():
+    return bin_abc(function=squared_bin,
+                   bits_count=4,
                    colony_size=10,
                    scouts=0.5,
                    iterations=10,
                    min_max='min',
+                   method='am',
                    nan_protection=True,
                    log_agents=True,
                    seed=42)
 
-base_bin_abc_obj = bin_abc(function=squared_bin,
-                           bits_count=4,
-                           transfer_function='sigmoid',
-                           colony_size=10,
-                           scouts=0.5,
-                           iterations=10,
-                           min_max='min',
-                           method='bin',
-                           result_format='best',
-                           nan_protection=3,
-                           log_agents=True,
-                           seed=42)
-
-base_am_abc_obj = bin_abc(function=squared_bin,
-                          bits_count=4,
-                          colony_size=10,
-                          scouts=0.5,
-                          iterations=10,
-                          min_max='min',
-                          method='am',
-                          nan_protection=True,
-                          log_agents=True,
-                          seed=42)
-
-average_nan_bin_abc_obj = bin_abc(function=squared_bin,
-                                  bits_count=8,
-                                  transfer_function='sigmoid',
-                                  colony_size=10,
-                                  scouts=0.5,
-                                  iterations=10,
-                                  min_max='min',
-                                  method='bin',
-                                  result_format='average',
-                                  nan_protection=3,
-                                  log_agents=True,
-                                  seed=42)
-
-nan_bin_abc_obj = bin_abc(function=squared_bin,
-                          bits_count=8,
-                          transfer_function='sigmoid',
-                          colony_size=60,
-                          scouts=10,
-                          iterations=30,
-                          min_max='min',
-                          method='bin',
-                          result_format='average',
-                          nan_protection=3,
-                          log_agents=True,
-                          seed=42)
-
-
-def test_food_source_generation():
+@pytest.fixture(scope='module')
+def average_nan_bin_abc_obj():
+    return bin_abc(function=squared_bin,
+                   bits_count=8,
+                   transfer_function='sigmoid',
+                   colony_size=10,
+                   scouts=0.5,
+                   iterations=10,
+                   min_max='min',
+                   method='bin',
+                   result_format='average',
+                   nan_protection=3,
+                   log_agents=True,
+                   seed=42)
+
+@pytest.fixture(scope='module')
+def nan_bin_abc_obj():
+    return bin_abc(function=squared_bin,
+                   bits_count=8,
+                   transfer_function='sigmoid',
+                   colony_size=60,
+                   scouts=10,
+                   iterations=30,
+                   min_max='min',
+                   method='bin',
+                   result_format='average',
+                   nan_protection=3,
+                   log_agents=True,
+                   seed=42)
+
+
+def test_food_source_generation(base_abc_obj):
     # Test algorithm initialization
-    global base_abc_obj
-    out = [food.position for food in base_abc_obj.foods]
-    ref = [[2.7885359691576745, -9.49978489554666],
-           [-4.499413632617615, -5.5357852370235445],
-           [7.843591354096908, -8.261223347411677],
-           [-1.561563606294591, -9.404055611238594],
-           [-5.627240503927933, 0.10710576206724731]]
+    out = base_abc_obj.positions
+    ref = [[5.479120971119267, -1.2224312049589532],
+           [-1.131716023453377, -5.455225564304462],
+           [-8.11645304224701, 9.512447032735118],
+           [1.0916957403166965, -8.723654877916493],
+           [-7.4377273464890825, -0.9922812420886569]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_fit_solution():
+def test_fit_solution(base_abc_obj):
     # Test solver capability
-    global base_abc_obj
     abc_obj = deepcopy(base_abc_obj)
     abc_obj.fit()
     out = abc_obj.get_solution()
-    ref = [0.004621261711518124, -0.08296007192538377]
+    ref = [0.030993154376346976, -0.14526363590974745]
     npt.assert_array_almost_equal(out, ref, decimal=6)
+    out[0] += 1 #Returned solution is a copy, not linked to the solver
+    assert abc_obj.get_solution()[0] != out[0]
 
 
-def test_get_agents():
+def test_get_agents(base_abc_obj):
     # Verifies the process step-by-step
-    global base_abc_obj
     abc_obj = deepcopy(base_abc_obj)
     abc_obj.fit()
     out = abc_obj.get_agents()
-    ref = [[[2.7885359691576745, -9.49978489554666],
-            [-4.499413632617615, -5.5357852370235445],
-            [7.843591354096908, -8.261223347411677],
-            [-1.561563606294591, -9.404055611238594],
-            [-5.627240503927933, 0.10710576206724731]],
-           [[2.7885359691576745, -8.233291099602813],
-            [1.5832471812626028, -5.5357852370235445],
-            [3.7358052227687066, -8.261223347411677],
-            [-1.2017059867618722, -9.404055611238594],
-            [-5.177686266266753, 0.10710576206724731]],
-           [[2.7885359691576745, -8.233291099602813],
-            [1.5832471812626028, -5.5357852370235445],
-            [3.07809973415758, -3.1160692355609463],
-            [-1.2017059867618722, -9.404055611238594],
-            [-0.626259589706855, 0.10710576206724731]],
-           [[2.7885359691576745, -5.5667304312754515],
-            [1.5832471812626028, -4.793940503704757],
-            [3.07809973415758, -3.1160692355609463],
-            [-1.2017059867618722, -9.404055611238594],
-            [-0.626259589706855, -0.08296007192538377]],
-           [[2.7885359691576745, -5.5667304312754515],
-            [1.5832471812626028, -4.793940503704757],
-            [3.07809973415758, -2.9972606160578668],
-            [-1.2017059867618722, -2.33874341261713],
-            [0.004621261711518124, -0.08296007192538377]],
-           [[2.7885359691576745, -5.5667304312754515],
-            [1.5832471812626028, -1.4037521889161138],
-            [3.07809973415758, -2.8781556401746196],
-            [-0.23585290985708707, -0.35015979771326466],
-            [0.004621261711518124, -0.08296007192538377]],
-           [[2.7885359691576745, -5.5667304312754515],
-            [0.18420441941726584, -1.4037521889161138],
-            [3.07809973415758, -2.8781556401746196],
-            [-0.23585290985708707, -0.35015979771326466],
-            [7.585404849690857, -2.609458225222321]],
-           [[2.7885359691576745, -0.8101232115728161],
-            [0.18420441941726584, -1.4037521889161138],
-            [3.07809973415758, -2.8781556401746196],
-            [9.443925300345207, -9.202102437775636],
-            [5.401373297801247, -2.609458225222321]],
-           [[2.683096137661125, -0.8101232115728161],
-            [-6.4286436765507275, 9.25068631523111],
-            [-2.3425767195845317, -2.262486375815069],
-            [9.443925300345207, -4.543441485273379],
-            [5.401373297801247, -1.4635223212335464]],
-           [[-1.2529852411980031, -0.019504875840150926],
-            [-6.4286436765507275, 9.25068631523111],
-            [0.36371179397453135, -2.262486375815069],
-            [6.465646902426063, -4.543441485273379],
-            [5.319323057174841, -1.4635223212335464]],
-           [[-0.5647328495432691, -0.019504875840150926],
-            [-6.4286436765507275, 9.25068631523111],
-            [0.36371179397453135, -1.6127483532703213],
-            [6.465646902426063, -4.543441485273379],
-            [5.319323057174841, -1.4635223212335464]]]
+    ref = [[[5.479120971119267, -1.2224312049589532],
+            [-1.131716023453377, -5.455225564304462],
+            [-8.11645304224701, 9.512447032735118],
+            [1.0916957403166965, -8.723654877916493],
+            [-7.4377273464890825, -0.9922812420886569]],
+           [[5.479120971119267, -1.2224312049589532],
+            [-1.131716023453377, -3.3135469111172218],
+            [-8.11645304224701, 9.512447032735118],
+            [1.0916957403166965, -8.723654877916493],
+            [-6.811993671664382, 0.300122867074218]],
+           [[5.479120971119267, -0.733637455992471],
+            [0.4702411081706488, -1.0098657569218759],
+            [-7.662045554857888, 9.512447032735118],
+            [1.0916957403166965, -6.780233438530253],
+            [-6.811993671664382, 0.08009237764587893]],
+           [[5.479120971119267, -0.733637455992471],
+            [0.030993154376346976, -0.14526363590974745],
+            [-7.662045554857888, -0.10211318250699719],
+            [1.0916957403166965, -6.780233438530253],
+            [-6.811993671664382, 0.08009237764587893]],
+           [[5.479120971119267, -0.733637455992471],
+            [-4.682600770809609, 9.383527546954479],
+            [-7.662045554857888, -0.07501293855490632],
+            [1.0916957403166965, -2.7528730294055217],
+            [-6.811993671664382, 0.08009237764587893]],
+           [[5.479120971119267, -0.733637455992471],
+            [-4.682600770809609, 8.48869040136276],
+            [-7.156032390331502, -0.07501293855490632],
+            [1.0916957403166965, -2.7528730294055217],
+            [-6.811993671664382, 0.08009237764587893]],
+           [[-7.828485177291129, 3.4448018607962343],
+            [-4.682600770809609, 0.4635895473926972],
+            [-7.156032390331502, -0.07501293855490632],
+            [0.8119594641909866, -2.5061687244457116],
+            [0.4824204958389835, 0.08009237764587893]],
+           [[-7.828485177291129, 3.4448018607962343],
+            [-4.682600770809609, 0.4635895473926972],
+            [-7.156032390331502, -0.07501293855490632],
+            [0.8119594641909866, -2.5061687244457116],
+            [0.4824204958389835, 0.08009237764587893]],
+           [[-7.033568816059817, 3.4448018607962343],
+            [-4.682600770809609, 0.4635895473926972],
+            [-7.156032390331502, -0.07501293855490632],
+            [-7.36355564426958, 3.55317347225715],
+            [0.4824204958389835, 0.08009237764587893]],
+           [[-7.033568816059817, 3.4448018607962343],
+            [-4.682600770809609, 0.4635895473926972],
+            [-7.156032390331502, -0.07501293855490632],
+            [-5.385320606294179, 3.55317347225715],
+            [5.695268985043748, -9.643264320460245]],
+           [[-7.033568816059817, 3.4218236501370107],
+            [-1.2259220017595969, 0.4635895473926972],
+            [8.419409449749004, -6.689365545294437],
+            [-5.385320606294179, 3.55317347225715],
+            [5.695268985043748, -7.100057345404778]]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_get_status():
+def test_get_status(base_abc_obj):
     # Test exploration and NaN protection
-    global base_abc_obj
     abc_obj = deepcopy(base_abc_obj)
     abc_obj.fit()
     out = abc_obj.get_status()
-    ref = (10, 3, 3)
+    ref = (10, 5, 7)
     npt.assert_array_equal(out, ref)
 
 
-def test_bin_food_source_generation():
+def test_rwde_scout_strategy():
+    # Test RWDE scout bees and its NaN protection
+    abc_obj = abc(function=sphere,
+                  boundaries=[(-10,10) for _ in range(2)],
+                  colony_size=10,
+                  scouts=0.5,
+                  iterations=10,
+                  min_max='min',
+                  nan_protection=True,
+                  seed=42,
+                  scout_strategy='rwde',
+                  scout_lambda=0.1)
+    abc_obj.fit()
+    out1 = abc_obj.get_status()
+    out2 = abc_obj.get_solution()
+    ref1 = (10, 3, 4)
+    ref2 = [0.030993154376346976, -0.14526363590974745]
+    npt.assert_array_equal(out1, ref1)
+    npt.assert_array_almost_equal(out2, ref2, decimal=6)
+
+    # Forced scout event: the food source must be placed around the best solution
+    abc_obj.trial_counters[:] = 0
+    abc_obj.trial_counters[0] = abc_obj.scout_limit + 1
+    random_abc_obj = deepcopy(abc_obj)
+    random_abc_obj.scout_strategy = 'random'
+    abc_obj._engine.scout_bee_phase()
+    random_abc_obj._engine.scout_bee_phase()
+    out3 = abc_obj.positions[0]
+    assert np.all((out3 >= abc_obj.lower_bounds) & (out3 <= abc_obj.upper_bounds))
+    assert np.all(np.abs(out3 - abc_obj.best_position) <= \
+                  abc_obj.scout_lambda*abc_obj.bounds_range)
+    assert not np.allclose(out3, random_abc_obj.positions[0])
+
+
+def test_float32_dtype():
+    # Test single precision storage of food sources
+    abc_obj = abc(function=sphere,
+                  boundaries=[(-10,10) for _ in range(2)],
+                  colony_size=10,
+                  iterations=10,
+                  log_agents=True,
+                  seed=42,
+                  dtype=np.float32)
+    abc_obj.fit()
+    assert abc_obj.positions.dtype == np.float32
+    assert abc_obj.fits.dtype == np.float64
+    assert abc_obj.get_agents().dtype == np.float32
+    out = abc_obj.get_solution()
+    ref = [-0.013860702514648438, 0.01344794686883688]
+    npt.assert_array_almost_equal(out, ref, decimal=6)
+
+
+@pytest.fixture(scope='module')
+def ref_agents(base_abc_obj):
+    # Food sources path of the scalar cost function with serial evaluation
+    ref_abc_obj = deepcopy(base_abc_obj)
+    ref_abc_obj.fit()
+    return ref_abc_obj.get_agents()
+
+
+@pytest.fixture(scope='module')
+def thread_pool():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize('mode', ['vectorized', 'jitted', 'map_workers', 'process_workers'])
+def test_evaluation_mode_get_agents(mode, ref_agents, thread_pool):
+    # Every evaluation mode must follow the same path of the scalar and serial one
+    if (mode == 'vectorized'):
+        options = dict(function=vectorized_sphere, vectorized=True)
+    elif (mode == 'jitted'):
+        nb = pytest.importorskip('numba')
+        options = dict(function=nb.njit(sphere))
+    elif (mode == 'map_workers'):
+        options = dict(function=sphere, workers=thread_pool.map)
+    elif (mode == 'process_workers'):
+        options = dict(function=sphere, workers=2)
+    abc_obj = abc(boundaries=[(-10,10) for _ in range(2)],
+                  colony_size=10,
+                  scouts=0.5,
+                  iterations=10,
+                  min_max='min',
+                  nan_protection=True,
+                  log_agents=True,
+                  seed=42,
+                  **options)
+    abc_obj = deepcopy(abc_obj) #Copies share the same workers
+    assert abc_obj.workers is options.get('workers', 1)
+    abc_obj.fit()
+    out = abc_obj.get_agents()
+    npt.assert_array_almost_equal(out, ref_agents, decimal=6)
+
+
+def test_lazy_numba_import():
+    # Numba must only be imported when a numba compiled cost function is given
+    code = 'import sys, beecolpy; assert \'numba\' not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
+
+def test_bin_food_source_generation(base_bin_abc_obj):
     # Test algorithm initialization
-    global base_bin_abc_obj
-    out = [food.position for food in base_bin_abc_obj._bin_abc_object.foods]
-    ref = [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-           [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-           [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-           [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-           [0.7245618290940143, 9.462315279587411, -2.42931245583293, 1.0408126254645396]]
+    out = base_bin_abc_obj._bin_abc_object.positions
+    ref = [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+           [-8.11645304224701, 9.512447032735118, 5.222794039807059, 5.721286105539075],
+           [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+           [2.8773024016132904, 6.455232265416598, -1.131716023453377, -5.455225564304462],
+           [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_bin_fit_best_solution():
+def test_bin_fit_best_solution(base_bin_abc_obj):
     # Test solver capability
-    global base_bin_abc_obj
     bin_abc_obj = deepcopy(base_bin_abc_obj)
     bin_abc_obj.fit()
     out = bin_abc_obj.get_solution()
@@ -213,135 +335,128 @@ def test_bin_fit_best_solution():
     npt.assert_array_equal(out, ref)
 
 
-def test_bin_fit_average_solution():
+def test_bin_fit_average_solution(average_nan_bin_abc_obj):
     # Test solver capability
-    global average_nan_bin_abc_obj
     bin_abc_obj = deepcopy(average_nan_bin_abc_obj)
     bin_abc_obj.fit()
     out = bin_abc_obj.get_solution()
-    ref = [False, False, False, False, True, False, False, False]
+    ref = [False, True, False, False, True, False, False, True]
     npt.assert_array_equal(out, ref)
 
 
-def test_bin_fit_average_probability():
+def test_bin_fit_average_probability(average_nan_bin_abc_obj):
     # Test solver capability
-    global average_nan_bin_abc_obj
     bin_abc_obj = deepcopy(average_nan_bin_abc_obj)
     bin_abc_obj.fit()
     out = bin_abc_obj.get_solution(probability_vector = True)
-    ref = [0.7310473617198062,
-           0.014879869353197546,
-           0.017970912760133604,
-           0.0010584454334110485,
-           0.985098442266522,
-           0.19047384206718057,
-           0.0014741775024230605,
-           0.05895833890958545]
+    ref = [0.30540620662144796,
+           0.7981584123142117,
+           0.0007430083151950493,
+           4.5397868702434395e-05,
+           0.9666912565372553,
+           0.3593754543801196,
+           0.14095403330562237,
+           0.9950330854126368]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_bin_nan_protection():
+def test_bin_nan_protection(nan_bin_abc_obj):
     # Test NaN protection in BABC
-    global nan_bin_abc_obj
     bin_abc_obj = deepcopy(nan_bin_abc_obj)
     bin_abc_obj.fit()
     out1 = bin_abc_obj.get_status()
     out2 = bin_abc_obj.get_solution(probability_vector = False)
-    ref1 = (30, 28, 36)
-    ref2 = [False, False, False, False, True, False, False, False]
+    ref1 = (30, 29, 42)
+    ref2 = [False, False, False, False, False, False, False, True]
     npt.assert_array_equal(out1, ref1)
     npt.assert_array_equal(out2, ref2)
 
 
-def test_bin_get_agents():
+def test_bin_get_agents(base_bin_abc_obj):
     # Verifies the process step-by-step
-    global base_bin_abc_obj
     bin_abc_obj = deepcopy(base_bin_abc_obj)
     bin_abc_obj.fit()
     out = bin_abc_obj.get_agents()
-    ref = [[[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.7245618290940143, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.7245618290940143, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.7245618290940143, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.7245618290940143, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.591187559186066, 1.7853136775181753, 6.1886091335565325, -9.87002480643878],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[2.7885359691576745, -9.49978489554666, -4.499413632617615, -5.5357852370235445],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.310128439707293, -3.2830492675737215, 7.860536655806335, -8.38844684684663],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[-7.838025006847868, -9.48643149005068, -3.7608551121060962, 3.5469457370081763],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.310128439707293, -3.2830492675737215, 7.860536655806335, -8.38844684684663],
-            [9.144261444135623, -3.2681090977474643, -8.145083132397042, -8.06567246333072],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[-7.838025006847868, -9.48643149005068, -3.7608551121060962, 3.5469457370081763],
-            [-1.561563606294591, -9.404055611238594, -5.627240503927933, 0.10710576206724731],
-            [-5.310128439707293, -3.2830492675737215, 7.860536655806335, -8.38844684684663],
-            [-4.470007460626215, 1.7917381192158182, 5.204157907461653, 1.9358148102460344],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[-7.838025006847868, -9.48643149005068, -3.7608551121060962, 3.5469457370081763],
-            [-1.2448227285680407, 1.9607332408220728, 7.788457785849072, 4.690678465712306],
-            [-5.310128439707293, -3.2830492675737215, 7.860536655806335, -8.38844684684663],
-            [-4.470007460626215, 1.7917381192158182, 5.204157907461653, 1.9358148102460344],
-            [0.8967570342570317, 9.462315279587411, -2.42931245583293, 1.0408126254645396]],
-           [[-7.838025006847868, -9.48643149005068, -3.7608551121060962, 3.5469457370081763],
-            [-1.2448227285680407, 1.9607332408220728, 7.788457785849072, 4.690678465712306],
-            [-5.310128439707293, -3.2830492675737215, 7.860536655806335, -8.38844684684663],
-            [-4.470007460626215, 1.7917381192158182, 5.204157907461653, 1.9358148102460344],
-            [-4.343220334343467, -4.028883004564657, 1.7387544482832222, 9.978046664586774]]]
+    ref = [[[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [-8.11645304224701, 9.512447032735118, 5.222794039807059, 5.721286105539075],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [2.8773024016132904, 6.455232265416598, -1.131716023453377, -5.455225564304462],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [-8.11645304224701, 9.512447032735118, 9.386665198736406, 5.721286105539075],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [2.8773024016132904, 6.455232265416598, -1.131716023453377, -5.455225564304462],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [-8.11645304224701, 9.512447032735118, 9.386665198736406, 5.721286105539075],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [2.8773024016132904, 6.455232265416598, -1.131716023453377, -5.455225564304462],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [-8.11645304224701, 9.512447032735118, 9.386665198736406, 5.721286105539075],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [2.8773024016132904, -4.479729162803574, -1.131716023453377, -5.455225564304462],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [2.8773024016132904, -4.479729162803574, -1.131716023453377, -5.455225564304462],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [-7.4377273464890825, -0.9922812420886569, -2.5840395153483753, 8.535299776972035],
+            [1.7528914435542404, -6.588140629262278, 8.502402367535943, 1.621222794007899],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [4.539892285737652, 5.37294983835314, -7.845181080882069, 8.320236902752157],
+            [1.7528914435542404, -6.39145819226256, 8.502402367535943, 1.621222794007899],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [4.539892285737652, 5.37294983835314, -7.845181080882069, 8.320236902752157],
+            [1.7528914435542404, -6.39145819226256, 8.502402367535943, 1.621222794007899],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [4.539892285737652, 5.37294983835314, -7.845181080882069, 8.320236902752157],
+            [-6.004486966798847, 6.082490523645255, 4.308142592316033, 4.779680078310836],
+            [1.0916957403166965, -8.723654877916493, 6.55262343985164, 2.6332879824412974]],
+           [[5.479120971119267, -1.2224312049589532, 7.171958398227648, 3.9473605811872776],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [4.539892285737652, 5.37294983835314, -7.845181080882069, 8.320236902752157],
+            [-6.004486966798847, 6.082490523645255, 4.308142592316033, 4.779680078310836],
+            [5.936341766503235, -5.3471851606713265, 0.6153918119810697, 2.120316414000218]],
+           [[-8.892091816714798, -6.507170581282946, -8.932361347456492, 1.8228763222194253],
+            [8.171613814152142, 3.9941426762149916, -4.682600770809609, 9.383527546954479],
+            [4.539892285737652, 5.37294983835314, -7.845181080882069, 8.320236902752157],
+            [-6.004486966798847, 6.082490523645255, 4.308142592316033, 4.779680078310836],
+            [5.936341766503235, -5.3471851606713265, 0.6153918119810697, 2.120316414000218]]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_bin_get_status():
+def test_bin_get_status(base_bin_abc_obj):
     # Test exploration
-    global base_bin_abc_obj
     bin_abc_obj = deepcopy(base_bin_abc_obj)
     bin_abc_obj.fit()
     out = bin_abc_obj.get_status()
-    ref = (10, 5, 0)
+    ref = (10, 6, 0)
     npt.assert_array_equal(out, ref)
 
 
-def test_am_food_source_generation():
+def test_am_food_source_generation(base_am_abc_obj):
     # Test algorithm initialization
-    global base_am_abc_obj
-    out = [food.position for food in base_am_abc_obj._bin_abc_object.foods]
-    ref = [[0.557707193831535, -1.8999569791093323, -0.899882726523523, -1.107157047404709],
-           [0.9458848566560496, 0.7067979496916452, 1.5687182708193816, -1.6522446694823354],
-           [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-           [-1.8938561212645455, -1.204649397253406, 0.5995377511180928, 0.1797659224128667],
-           [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]]
+    out = base_am_abc_obj._bin_abc_object.positions
+    ref = [[1.0958241942238534, -0.24448624099179073, 1.4343916796455298, 0.7894721162374556],
+           [-1.6232906084494019, 1.9024894065470237, 1.0445588079614119, 1.1442572211078152],
+           [-1.4875454692978165, -0.19845624841773146, -0.5168079030696751, 1.7070599553944072],
+           [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+           [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 0.5266575964882594]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_am_fit_solution():
+def test_am_fit_solution(base_am_abc_obj):
     # Test solver capability
-    global base_am_abc_obj
     am_abc_obj = deepcopy(base_am_abc_obj)
     am_abc_obj.fit()
     out = am_abc_obj.get_solution()
@@ -349,75 +464,97 @@ def test_am_fit_solution():
     npt.assert_array_equal(out, ref)
 
 
-def test_am_get_agents():
+def test_am_get_agents(base_am_abc_obj):
     # Verifies the process step-by-step
-    global base_am_abc_obj
     am_abc_obj = deepcopy(base_am_abc_obj)
     am_abc_obj.fit()
     out = am_abc_obj.get_agents()
-    ref = [[[0.557707193831535, -1.8999569791093323, -0.899882726523523, -1.107157047404709],
-            [0.9458848566560496, 0.7067979496916452, 1.5687182708193816, -1.6522446694823354],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-1.8938561212645455, -1.204649397253406, 0.5995377511180928, 0.1797659224128667],
-            [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, -0.899882726523523, -1.107157047404709],
-            [1.0161392006272225, 0.7067979496916452, 1.5687182708193816, -1.6522446694823354],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.1797659224128667],
-            [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.107157047404709],
-            [1.0161392006272225, 0.7067979496916452, 1.5687182708193816, -1.6522446694823354],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.107157047404709],
-            [1.0161392006272225, 0.7067979496916452, 1.5687182708193816, -1.6522446694823354],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.7642204917687523],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -1.7645049324947064],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.2377218267113066, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.7642204917687523],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -0.7438010528471708],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.7642204917687523],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -0.7438010528471708],
-            [-0.3123127212589183, -1.8808111222477186, -1.1254481007855865, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.7642204917687523],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -0.7438010528471708],
-            [-0.3123127212589183, -1.8808111222477186, -0.10276323247356367, 0.02142115241344955],
-            [-2, -1.204649397253406, 0.5995377511180928, 0.3057522684219449],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]],
-           [[0.557707193831535, -1.8893582439328636, 0.3286988892938725, -1.7642204917687523],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -0.7438010528471708],
-            [-0.3123127212589183, -1.8808111222477186, -0.10276323247356367, 0.02142115241344955],
-            [-0.5852854615415266, 0.23953407657547876, 1.4988508941643648, 1.895348090549156],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]],
-           [[-0.617251553280799, 1.1457127128147278, -0.25442446451756817, 1.9369433972663597],
-            [0.3537604576414042, -1.9712366440596258, 0.8313637861938163, -0.7438010528471708],
-            [-0.3123127212589183, -1.8808111222477186, -0.10276323247356367, 0.02142115241344955],
-            [-0.5852854615415266, 0.23953407657547876, 1.4988508941643648, 1.895348090549156],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]],
-           [[-0.617251553280799, 1.1457127128147278, -0.25442446451756817, 1.9369433972663597],
-            [0.044695987498348355, 1.174941596424008, 1.839328014732145, 0.9438457837608869],
-            [-0.3123127212589183, -1.8808111222477186, -0.10276323247356367, 0.02142115241344955],
-            [-0.5852854615415266, 0.23953407657547876, 1.4988508941643648, 1.895348090549156],
-            [-1.1182375118372132, 0.3570627355036349, 1.140180015064122, -1.974004961287756]]]
+    ref = [[[1.0958241942238534, -0.24448624099179073, 1.4343916796455298, 0.7894721162374556],
+            [-1.6232906084494019, 1.9024894065470237, 1.0445588079614119, 1.1442572211078152],
+            [-1.4875454692978165, -0.19845624841773146, -0.5168079030696751, 1.7070599553944072],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 0.5266575964882594]],
+           [[1.0958241942238534, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 1.0445588079614119, 1.1442572211078152],
+            [-1.4875454692978165, -0.19845624841773146, -0.5168079030696751, 1.7070599553944072],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 0.5266575964882594]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 2.0, 1.1442572211078152],
+            [-1.4875454692978165, -0.19845624841773146, -0.5168079030696751, 1.7070599553944072],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 0.5266575964882594]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 2.0, 1.1442572211078152],
+            [-1.4875454692978165, -0.19845624841773146, -0.5168079030696751, 1.7070599553944072],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 0.5266575964882594]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 2.0, 1.1442572211078152],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 2.0, 1.1442572211078152],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [0.5754604803226582, 1.29104645308332, -0.22634320469067548, -1.0910451128608925],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-1.6232906084494019, 1.9024894065470237, 2.0, 1.1442572211078152],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [-1.5656970354582258, 0.6889603721592468, -0.8750648646439667, 0.6376905387676071],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[1.525374457574089, -0.24448624099179073, 1.4343916796455298, 0.45198466442918855],
+            [-0.736283792676828, 1.088049728443952, 0.6466450526710443, -0.5053690845051597],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [-1.5656970354582258, 0.6889603721592468, -0.8750648646439667, 0.6376905387676071],
+            [0.2183391480633392, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[-1.2008973933597695, 1.2164981047290508, 0.8616285184632066, 0.955936015662167],
+            [-0.736283792676828, 1.088049728443952, 0.6466450526710443, -0.5053690845051597],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [-1.5656970354582258, 0.6889603721592468, -0.8750648646439667, 0.6376905387676071],
+            [0.40808533346452835, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[-1.2008973933597695, 1.2164981047290508, 0.8616285184632066, 1.2315513789913228],
+            [-0.736283792676828, 1.088049728443952, 0.6466450526710443, -0.5053690845051597],
+            [1.6343227628304282, 0.7988285352429982, -0.9365201541619217, 1.8767055093908955],
+            [-1.5656970354582258, 0.6889603721592468, -0.8750648646439667, 0.6376905387676071],
+            [0.40808533346452835, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]],
+           [[-1.2008973933597695, 1.2164981047290508, 1.2324325146767663, 1.2315513789913228],
+            [-0.736283792676828, 1.088049728443952, 0.6466450526710443, -0.5053690845051597],
+            [-0.8611196706482578, -1.3855464192317655, -1.5380397453385801, -1.9154079346542399],
+            [-1.5656970354582258, 0.6889603721592468, 0.6816347007380212, 0.6376905387676071],
+            [0.40808533346452835, -1.7447309755832987, 1.3105246879703283, 1.116203285424207]]]
     npt.assert_array_almost_equal(out, ref, decimal=6)
 
 
-def test_am_get_status():
+def test_am_get_status(base_am_abc_obj):
     # Test exploration
-    global base_am_abc_obj
     am_abc_obj = deepcopy(base_am_abc_obj)
     am_abc_obj.fit()
     out = am_abc_obj.get_status()
-    ref = (10, 4, 0)
+    ref = (10, 5, 0)
     npt.assert_array_almost_equal(out, ref)
+
+
+def test_memoized_fit():
+    # Memoization must not change the result, only the number of function calls
+    for method in ('bin', 'am'):
+        calls = []
+        def counted_squared_bin(b):
+            calls.append(tuple(b))
+            return squared_bin(b)
+
+        solutions = []
+        for memoize in (False, True):
+            bin_abc_obj = bin_abc(function=counted_squared_bin,
+                                  bits_count=8,
+                                  colony_size=10,
+                                  iterations=10,
+                                  method=method,
+                                  seed=42,
+                                  memoize=memoize)
+            calls.clear()
+            solutions.append(bin_abc_obj.fit())
+            assert len(bin_abc_obj._cost_cache) == 0 #Stored costs only live during fit()
+        npt.assert_array_equal(solutions[1], solutions[0])
+        assert len(calls) == len(set(calls))
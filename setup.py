@@ -22,6 +22,7 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    install_requires=['numpy'],
+    install_requires=['numpy>=1.17'],
+    extras_require={'numba': ['numba']},
     python_requires='>=3.0'
 )